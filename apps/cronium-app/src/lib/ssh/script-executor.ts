@@ -206,30 +206,67 @@ global.cronium = new Cronium();
 
           // Create cronium runtime helper for Python
           const pythonHelper = `
+import contextlib
+import functools
 import json
 import os
 import sys
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _load_json(path):
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _write_json(data, f, indent):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        f.write(orjson.dumps(data, option=option))
+except ImportError:  # Fall back to the standard library
+    def _load_json(path):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _write_json(data, f, indent):
+        f.write(json.dumps(data, indent=2 if indent else None).encode("utf-8"))
+
+def _dump_json(data, path, indent=False):
+    # Write a temp file and swap it in, so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            _write_json(data, f, indent)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
 class Cronium:
     def __init__(self):
-        self._input_data = None
         self._event_data = ${eventData ? JSON.stringify(eventData) : "None"}
-        
+        self._variables = {}
+        self._variables_stamp = None
+        self._batching = False
+        self._variables_dirty = False
+
+    @functools.cached_property
+    def _input_data(self):
+        # Read on first use so scripts that never call input() skip the file
         try:
             if os.path.exists('input.json'):
-                with open('input.json', 'r') as f:
-                    self._input_data = json.load(f)
+                return _load_json('input.json')
         except Exception as e:
             print(f"Error loading input data: {e}", file=sys.stderr)
+        return None
 
     def input(self):
         return self._input_data or {}
 
     def output(self, data):
         try:
-            with open('output.json', 'w') as f:
-                json.dump(data, f, indent=2)
+            _dump_json(data, 'output.json', indent=True)
             return True
         except Exception as e:
             print(f"Error writing output: {e}", file=sys.stderr)
@@ -240,26 +277,33 @@ class Cronium:
 
     def setCondition(self, condition):
         try:
-            with open("condition.json", "w") as f:
-                json.dump({"condition": bool(condition)}, f)
+            _dump_json({"condition": bool(condition)}, "condition.json")
         except Exception as e:
             print(f"Error writing condition: {e}", file=sys.stderr)
 
     def getCondition(self):
         try:
-            with open("condition.json", "r") as f:
-                data = json.load(f)
-                return data.get("condition", False)
+            return _load_json("condition.json").get("condition", False)
         except FileNotFoundError:
             return False
         except json.JSONDecodeError:
             return False
 
+    def _load_variables(self):
+        # Writes deferred by batch() are newer than the file
+        if self._variables_dirty:
+            return self._variables
+        # Only re-parse variables.json when it changed since the last read
+        info = os.stat("variables.json")
+        stamp = (info.st_mtime_ns, info.st_size)
+        if stamp != self._variables_stamp:
+            self._variables = _load_json("variables.json")
+            self._variables_stamp = stamp
+        return self._variables
+
     def getVariable(self, key):
         try:
-            with open("variables.json", "r") as f:
-                variables = json.load(f)
-                return variables.get(key, "")
+            return self._load_variables().get(key, "")
         except FileNotFoundError:
             return ""
         except json.JSONDecodeError:
@@ -267,21 +311,53 @@ class Cronium:
 
     def setVariable(self, key, value):
         try:
-            variables = {}
-            if os.path.exists("variables.json"):
-                with open("variables.json", "r") as f:
-                    variables = json.load(f)
+            try:
+                variables = self._load_variables()
+            except FileNotFoundError:
+                variables = self._variables = {}
             
             variables[key] = str(value)
             variables["__updated__"] = datetime.now().isoformat()
             
-            with open("variables.json", "w") as f:
-                json.dump(variables, f, indent=2)
+            if self._batching:
+                self._variables_dirty = True
+                return True
+            self._save_variables()
             return True
         except Exception as e:
             print(f"Error writing variable: {e}", file=sys.stderr)
             return False
 
+    def _save_variables(self):
+        _dump_json(self._variables, "variables.json", indent=True)
+        info = os.stat("variables.json")
+        self._variables_stamp = (info.st_mtime_ns, info.st_size)
+        self._variables_dirty = False
+
+    def flush(self):
+        """Write variables set inside batch() to variables.json."""
+        if not self._variables_dirty:
+            return True
+        try:
+            self._save_variables()
+            return True
+        except Exception as e:
+            print(f"Error writing variables: {e}", file=sys.stderr)
+            return False
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer variables.json writes until the block exits, then write once."""
+        if self._batching:
+            yield self
+            return
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.flush()
+
 cronium = Cronium()
 `;
 
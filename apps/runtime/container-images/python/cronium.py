@@ -7,16 +7,51 @@ variables, input/output data, and tool actions.
 """
 
 import os
+import sys
 import json
 import time
+import random
 import asyncio
-from typing import Any, Dict, Optional, Union, AsyncIterator
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin, quote
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, asynccontextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union, AsyncIterator, Iterator
+from http.client import HTTPConnection, HTTPSConnection
+from urllib.parse import urlsplit, quote
 import ssl
 import logging
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers past 64 bits, which the json module still encodes
+            return json.dumps(obj).encode("utf-8")
+    
+    _loads = orjson.loads
+except ImportError:  # Fall back to the standard library
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    
+    _loads = json.loads
+
+__version__ = "2.0.0"
+
+# The convenience functions are created lazily by __getattr__, listing them
+# here keeps them in `from cronium import *`
+__all__ = [
+    "Cronium", "AsyncCronium", "CroniumError", "CroniumAPIError", "CroniumTimeoutError",
+    "run", "gather", "cronium",
+    "input", "output", "get_variable", "set_variable", "get_variables",
+    "set_variables", "set_condition", "event", "execute_tool_action",
+    "send_email", "send_slack_message", "send_discord_message",
+]
+
 # Set up logging
 logger = logging.getLogger("cronium")
 logger.setLevel(logging.DEBUG if os.environ.get("CRONIUM_DEBUG") else logging.INFO)
@@ -40,47 +75,488 @@ class CroniumTimeoutError(CroniumError):
     pass
 
 
+# Marker for a variable that is not in the local cache
+_MISSING = object()
+
+# Requests that can be safely repeated after a failure
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+
+# Default SSL context, shared by all clients and only built for HTTPS
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def _default_ssl_context() -> ssl.SSLContext:
+    """Get the shared default SSL context, loading the CA store on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+def _backoff(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff delay for the given retry attempt."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+@lru_cache(maxsize=512)
+def _quote_key(key: str) -> str:
+    """URL-encode a variable key as a single path segment, including any '/'."""
+    return quote(key, safe="")
+
+
+def _error_message(body: bytes, default: str) -> str:
+    """Extract the error message from an API error response body."""
+    try:
+        return _loads(body).get("message", default)
+    except (ValueError, AttributeError):
+        return body.decode("utf-8", "replace") or default
+
+
+def _is_retryable(error: CroniumError) -> bool:
+    """Whether a failed attempt may succeed if repeated: 5xx, timeouts and connection failures."""
+    if isinstance(error, CroniumAPIError):
+        return error.status_code >= 500
+    return True
+
+
+def _encode_body(data: Any) -> Optional[bytes]:
+    """Serialize a request body; bytes are passed through as encoded JSON."""
+    if data is None or isinstance(data, (bytes, bytearray)):
+        return data
+    return _dumps(data)
+
+
+def _extract(result: Any, keys: tuple) -> Any:
+    """Walk nested response fields, e.g. ("data", "value"), giving None when one is missing."""
+    for key in keys:
+        if not result:
+            return None
+        result = result.get(key)
+    return result
+
+
+def _tool_action_data(result: Any) -> Any:
+    """Get the data of a tool action result, raising if the tool reported a failure."""
+    if not result:
+        return None
+    if result.get("success") is False:
+        # Failed tool actions come back as 200 with the reason in "error"
+        raise CroniumAPIError(200, result.get("error") or result.get("message") or "Tool action failed")
+    return result.get("data")
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """HTTP connection over a Unix domain socket instead of TCP."""
+    
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _ConnectionPool:
+    """
+    Pool of keep-alive HTTP connections to the Runtime API.
+    
+    Connections are reused across calls so only the first request of an
+    execution pays for the TCP (and TLS) handshake. Idle connections are
+    handed out LIFO, so concurrent callers each get their own connection.
+    """
+    
+    def __init__(self, base_url: str, timeout: float = 30,
+                 ssl_context: Optional[ssl.SSLContext] = None, maxsize: int = 16,
+                 socket_path: Optional[str] = None):
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.maxsize = maxsize
+        self.socket_path = socket_path
+        self._addresses: Optional[list] = None
+        self._idle = []
+        self._lock = threading.Lock()
+        self.set_base_url(base_url)
+    
+    def set_base_url(self, base_url: str) -> None:
+        """Point new connections at base_url and drop those to the old one."""
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.refresh_dns()
+    
+    def _resolve(self) -> list:
+        """
+        Resolve the host once so new connections skip the DNS lookup.
+        
+        Only plain HTTP connects by address; HTTPS keeps the hostname for SNI
+        and certificate checks. Returns an empty list if resolution failed,
+        leaving it to the connection.
+        """
+        if self._addresses is None:
+            try:
+                self._addresses = socket.getaddrinfo(self.host, self.port or 80, type=socket.SOCK_STREAM)
+            except OSError:
+                return []  # Leave resolution to the connection, retry next time
+        return self._addresses
+    
+    def _connect_resolved(self, address, timeout, source_address=None) -> socket.socket:
+        """
+        Connect to the first reachable resolved address.
+        
+        Drop-in for socket.create_connection that tries every cached address
+        in order, so e.g. localhost still falls back from ::1 to 127.0.0.1.
+        """
+        addresses = self._resolve()
+        if not addresses:
+            return socket.create_connection(address, timeout, source_address)
+        
+        error = None
+        for family, sock_type, proto, _, sockaddr in addresses:
+            sock = None
+            try:
+                sock = socket.socket(family, sock_type, proto)
+                sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                error = e
+                if sock is not None:
+                    sock.close()
+        raise error
+    
+    def refresh_dns(self) -> None:
+        """Forget the resolved addresses and drop connections made to them."""
+        self._addresses = None
+        self.close()
+    
+    def _new_connection(self) -> HTTPConnection:
+        if self.socket_path:
+            return _UnixHTTPConnection(self.socket_path, self.timeout)
+        # Pass the port explicitly, a bare IPv6 host would be split on ':'
+        if self.scheme == "https":
+            context = self.ssl_context or _default_ssl_context()
+            return HTTPSConnection(self.host, self.port or 443, timeout=self.timeout, context=context)
+        conn = HTTPConnection(self.host, self.port or 80, timeout=self.timeout)
+        conn._create_connection = self._connect_resolved
+        return conn
+    
+    def _acquire(self):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            return self._new_connection(), False
+        if conn.timeout != self.timeout:
+            # The timeout was changed after this connection was made
+            conn.timeout = self.timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(self.timeout)
+        return conn, True
+    
+    def _release(self, conn: HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+    
+    def request(self, method: str, path: str, body: Optional[bytes], headers: Dict[str, bytes]):
+        """
+        Send a request and read the full response.
+        
+        A stale keep-alive connection is replaced transparently, but once the
+        request has been written only idempotent methods are resent: the
+        server may already have acted on e.g. a tool action POST.
+        
+        Returns:
+            Tuple of (response, body bytes)
+        """
+        while True:
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except ConnectionError:
+                conn.close()
+                if reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    # The server closed an idle keep-alive connection, try a fresh one
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return response, data
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class _CircuitBreaker:
+    """
+    Circuit breaker for Runtime API calls.
+    
+    After failure_threshold consecutive failed calls the circuit opens and
+    further calls fail immediately instead of each spending its full retry
+    budget. Once reset_timeout has passed a single probe call is let through;
+    its outcome closes the circuit again or re-opens it. A probe that never
+    reports back is replaced by another after a further reset_timeout.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Check whether a call may be attempted."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                # Let one probe through, timed from now in case it is lost
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return True
+            return False
+    
+    def release_probe(self) -> None:
+        """Give up a probe that ended without an outcome, so the next call can probe."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic() - self.reset_timeout
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+    
+    def record_failure(self) -> bool:
+        """
+        Record a failed call.
+        
+        Returns:
+            True if this failure opened the circuit
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
 class Cronium:
     """
     Main class for interacting with the Cronium Runtime API.
     
-    This class is instantiated automatically when the module is imported,
+    A default instance is created on first use of the module-level functions,
     and provides methods for all runtime operations.
     """
     
     def __init__(self):
         """Initialize the Cronium client from environment variables."""
-        self.api_url = os.environ.get("CRONIUM_RUNTIME_API", "http://localhost:8081")
+        api_url = os.environ.get("CRONIUM_RUNTIME_API", "http://localhost:8081")
         self.token = os.environ.get("CRONIUM_EXECUTION_TOKEN")
         self.execution_id = os.environ.get("CRONIUM_EXECUTION_ID")
+        # Optional Unix domain socket for a Runtime API on the same host
+        self.socket_path = os.environ.get("CRONIUM_RUNTIME_SOCK")
         
         if not self.token:
             raise CroniumError("CRONIUM_EXECUTION_TOKEN environment variable not set")
         if not self.execution_id:
             raise CroniumError("CRONIUM_EXECUTION_ID environment variable not set")
         
+        # Endpoint paths for this execution, built once
+        execution_path = f"/executions/{self.execution_id}"
+        self._input_path = f"{execution_path}/input"
+        self._output_path = f"{execution_path}/output"
+        self._context_path = f"{execution_path}/context"
+        self._condition_path = f"{execution_path}/condition"
+        self._variables_path = f"{execution_path}/variables/"
+        self._tool_action_path = "/tool-actions/execute"
+        
+        # Sent as-is with every request, the api_url setter adds Host
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "User-Agent": f"cronium-python/{__version__}",
         }
         
+        # Keep-alive connections shared by all calls on this client
+        self._pool = _ConnectionPool(api_url, socket_path=self.socket_path)
+        self.api_url = api_url
+        
         # Retry configuration
         self.max_retries = 3
-        self.retry_delay = 1.0  # seconds
+        self.retry_delay = 1.0  # seconds, base for exponential backoff
+        self.max_retry_delay = 10.0  # seconds, cap for a single backoff
+        self.retry_deadline = 60.0  # seconds, overall budget including retries
         self.timeout = 30  # seconds
         
-        # SSL context for HTTPS
-        self.ssl_context = ssl.create_default_context()
+        # Fail fast while the Runtime API is unreachable
+        self._breaker = _CircuitBreaker()
+        
+        # Recently read or written variables: key -> (timestamp, value)
+        self.variable_cache_ttl = 5.0  # seconds, 0 disables caching
+        self._var_cache: Dict[str, tuple] = {}
+        
+        # Writes deferred by batch(), keyed by target so repeats coalesce
+        self._pending: Optional[Dict[str, tuple]] = None
+    
+    @property
+    def api_url(self) -> str:
+        """Runtime API base URL, assigning it redirects later requests."""
+        return self._api_url
+    
+    @api_url.setter
+    def api_url(self, url: str) -> None:
+        self._api_url = url
+        parts = urlsplit(url)
+        # scheme://host[:port] that endpoint paths are appended to
+        self._origin = f"{parts.scheme}://{parts.netloc}"
+        self.headers["Host"] = parts.netloc.rpartition("@")[2]
+        # http.client encodes str header values on every request, hand it bytes
+        self._encoded_headers = {name: value.encode("latin-1") for name, value in self.headers.items()}
+        self._pool.set_base_url(url)
+    
+    @property
+    def timeout(self) -> float:
+        """Request timeout in seconds, applied to new and pooled connections."""
+        return self._pool.timeout
+    
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        self._pool.timeout = value
+    
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """
+        SSL context for HTTPS connections.
+        
+        Until this is read or assigned, connections use the shared default
+        context. Reading it gives the client its own context, built on first
+        access, that can be customised in place.
+        """
+        if self._pool.ssl_context is None:
+            self._pool.ssl_context = ssl.create_default_context()
+            self._pool.close()
+        return self._pool.ssl_context
+    
+    @ssl_context.setter
+    def ssl_context(self, value: Optional[ssl.SSLContext]) -> None:
+        self._pool.ssl_context = value
+        # Idle connections were set up with the old context
+        self._pool.close()
+    
+    def _retry_delays(self, retryable: bool) -> Iterator[float]:
+        """
+        Get the jittered backoff delays to wait before each retry of a request.
+        
+        The retry deadline starts counting when this is called, so call it
+        before the first attempt. Yields nothing if the request is not
+        retryable.
+        
+        Raises:
+            CroniumTimeoutError: If the next delay would run past the retry deadline
+        """
+        deadline = time.monotonic() + self.retry_deadline
+        retries = self.max_retries - 1 if retryable else 0
+        
+        def delays() -> Iterator[float]:
+            for attempt in range(retries):
+                delay = _backoff(attempt, self.retry_delay, self.max_retry_delay)
+                if time.monotonic() + delay > deadline:
+                    raise CroniumTimeoutError("Retry deadline exceeded")
+                yield delay
+        
+        return delays()
+    
+    def _check_breaker(self) -> None:
+        """Raise if the circuit breaker is rejecting calls."""
+        if not self._breaker.allow():
+            raise CroniumAPIError(503, "Runtime API unavailable (circuit breaker open)")
+    
+    def _record_outcome(self, error: Optional[CroniumError]) -> None:
+        """Report a call outcome to the circuit breaker."""
+        if error is None or (isinstance(error, CroniumAPIError) and error.status_code < 500):
+            # Any non-5xx response means the Runtime API is reachable
+            self._breaker.record_success()
+        elif self._breaker.record_failure():
+            # The Runtime API may have moved, look it up again on recovery
+            self.refresh_dns()
+    
+    def refresh_dns(self) -> None:
+        """Re-resolve the Runtime API host on the next connection."""
+        self._pool.refresh_dns()
     
-    def _make_request(self, method: str, path: str, data: Any = None) -> Any:
+    def _make_request(self, method: str, path: str, data: Any = None,
+                      idempotent: bool = False, extract: tuple = ()) -> Any:
+        """
+        Make an HTTP request to the Runtime API through the circuit breaker.
+        
+        See _request_with_retry for arguments and errors. If extract is given,
+        the nested response field it names is returned instead of the whole
+        response.
+        """
+        self._check_breaker()
+        try:
+            result = self._request_with_retry(method, path, data, idempotent)
+        except CroniumError as e:
+            self._record_outcome(e)
+            raise
+        except BaseException:
+            # Failed locally (e.g. unserializable data), the API was not judged
+            self._breaker.release_probe()
+            raise
+        self._record_outcome(None)
+        return _extract(result, extract) if extract else result
+    
+    def _request_with_retry(self, method: str, path: str, data: Any = None,
+                            idempotent: bool = False) -> Any:
         """
         Make an HTTP request to the Runtime API with retry logic.
         
+        Only idempotent requests are retried, so side effects such as tool
+        actions never run twice.
+        
         Args:
             method: HTTP method (GET, POST, PUT, etc.)
             path: API endpoint path
-            data: Optional request body data
+            data: Optional request body data, or an already encoded JSON body
+            idempotent: Allow retrying a non-idempotent method (e.g. a POST
+                that overwrites state)
             
         Returns:
             Parsed JSON response
@@ -89,59 +565,44 @@ class Cronium:
             CroniumAPIError: If the API returns an error
             CroniumTimeoutError: If the request times out
         """
-        url = urljoin(self.api_url, path)
+        body = _encode_body(data)
+        delays = self._retry_delays(idempotent or method in _IDEMPOTENT_METHODS)
         
-        for attempt in range(self.max_retries):
+        while True:
             try:
-                # Prepare request
-                req_data = None
-                if data is not None:
-                    req_data = json.dumps(data).encode("utf-8")
-                
-                req = Request(url, data=req_data, headers=self.headers, method=method)
-                
-                # Make request with timeout
-                response = urlopen(req, timeout=self.timeout, context=self.ssl_context)
-                
-                # Read and parse response
-                response_data = response.read().decode("utf-8")
-                if response_data:
-                    result = json.loads(response_data)
-                    if isinstance(result, dict) and result.get("success") is False:
-                        raise CroniumAPIError(response.status, result.get("message", "Unknown error"))
-                    return result
-                return None
-                
-            except HTTPError as e:
-                # Handle HTTP errors
-                error_body = e.read().decode("utf-8")
-                try:
-                    error_data = json.loads(error_body)
-                    message = error_data.get("message", str(e))
-                except json.JSONDecodeError:
-                    message = error_body or str(e)
-                
-                if e.code >= 500 and attempt < self.max_retries - 1:
-                    # Retry on server errors
-                    time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
-                    continue
-                    
-                raise CroniumAPIError(e.code, message)
-                
-            except URLError as e:
-                if "timed out" in str(e) and attempt < self.max_retries - 1:
-                    # Retry on timeout
-                    time.sleep(self.retry_delay * (2 ** attempt))
-                    continue
-                raise CroniumTimeoutError(f"Request timed out: {e}")
-            
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (2 ** attempt))
-                    continue
-                raise CroniumError(f"Request failed: {e}")
+                return self._request_once(method, path, body)
+            except CroniumError as e:
+                if not _is_retryable(e):
+                    raise
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+    
+    def _request_once(self, method: str, path: str, body: Optional[bytes]) -> Any:
+        """
+        Make a single request attempt, without retrying.
         
-        raise CroniumError("Max retries exceeded")
+        Raises:
+            CroniumAPIError: If the API returns an error
+            CroniumTimeoutError: If the request times out
+            CroniumError: If the connection fails
+        """
+        try:
+            response, raw = self._pool.request(method, path, body, self._encoded_headers)
+            if response.status < 400:
+                return _loads(raw) if raw else None
+        except CroniumError:
+            raise
+        except socket.timeout as e:
+            raise CroniumTimeoutError(f"Request timed out: {e}") from e
+        except Exception as e:
+            raise CroniumError(f"Request failed: {e}") from e
+        
+        if response.status == 404 and method == "GET":
+            # A missing resource, e.g. an unset variable, needs no error body
+            raise CroniumAPIError(404, response.reason)
+        raise CroniumAPIError(response.status, _error_message(raw, response.reason))
     
     def input(self) -> Any:
         """
@@ -150,8 +611,7 @@ class Cronium:
         Returns:
             The input data passed to this execution, or None if no input.
         """
-        result = self._make_request("GET", f"/executions/{self.execution_id}/input")
-        return result.get("data") if result else None
+        return self._make_request("GET", self._input_path, extract=("data",))
     
     def output(self, data: Any) -> None:
         """
@@ -160,7 +620,8 @@ class Cronium:
         Args:
             data: The output data to store. Can be any JSON-serializable value.
         """
-        self._make_request("POST", f"/executions/{self.execution_id}/output", {"data": data})
+        if not self._defer_write("output", "POST", self._output_path, {"data": data}):
+            self._make_request("POST", self._output_path, {"data": data}, idempotent=True)
     
     def get_variable(self, key: str) -> Any:
         """
@@ -171,14 +632,23 @@ class Cronium:
             
         Returns:
             The variable value, or None if not set
+        
+        Values are cached for variable_cache_ttl seconds, so repeated reads of
+        the same key don't each hit the Runtime API.
         """
+        value = self._cached_variable(key)
+        if value is not _MISSING:
+            return value
+        
         try:
-            result = self._make_request("GET", f"/executions/{self.execution_id}/variables/{quote(key)}")
-            return result.get("data", {}).get("value") if result else None
+            value = self._make_request("GET", self._variables_path + _quote_key(key),
+                                       extract=("data", "value"))
         except CroniumAPIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+            if e.status_code != 404:
+                raise
+            value = None
+        self._cache_variable(key, value)
+        return value
     
     def set_variable(self, key: str, value: Any) -> None:
         """
@@ -188,7 +658,69 @@ class Cronium:
             key: The variable key to set
             value: The value to store. Can be any JSON-serializable value.
         """
-        self._make_request("PUT", f"/executions/{self.execution_id}/variables/{quote(key)}", {"value": value})
+        path = self._variables_path + _quote_key(key)
+        if not self._defer_write(f"variable:{key}", "PUT", path, {"value": value}):
+            self._make_request("PUT", path, {"value": value})
+        self._cache_variable(key, value)
+    
+    def get_variables(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get several variable values concurrently.
+        
+        Keys in the local cache are served without a request; the rest are
+        fetched in parallel, so the round trips overlap.
+        
+        Args:
+            keys: The variable keys to retrieve
+            
+        Returns:
+            Mapping of each key to its value, or None if not set
+        """
+        values = {key: self._cached_variable(key) for key in keys}
+        missing = [key for key, value in values.items() if value is _MISSING]
+        values.update(zip(missing, gather([lambda key=key: self.get_variable(key) for key in missing])))
+        return values
+    
+    def set_variables(self, variables: Dict[str, Any]) -> None:
+        """
+        Set several variables concurrently.
+        
+        Inside batch() the writes are queued like set_variable() calls instead.
+        
+        Args:
+            variables: Mapping of variable keys to values
+        """
+        if self._pending is not None:
+            for key, value in variables.items():
+                self.set_variable(key, value)
+            return
+        
+        gather([lambda key=key, value=value: self.set_variable(key, value)
+                for key, value in variables.items()])
+    
+    def _cached_variable(self, key: str) -> Any:
+        """Get a variable from the local cache, or _MISSING if absent or expired."""
+        entry = self._var_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.variable_cache_ttl:
+            return entry[1]
+        return _MISSING
+    
+    def _cache_variable(self, key: str, value: Any) -> None:
+        if self.variable_cache_ttl > 0:
+            self._var_cache[key] = (time.monotonic(), value)
+    
+    def invalidate_variable(self, key: str) -> None:
+        """
+        Drop a variable from the local cache so the next read hits the API.
+        
+        Args:
+            key: The variable key to invalidate
+        """
+        self._var_cache.pop(key, None)
+    
+    def clear_variable_cache(self) -> None:
+        """Drop all variables from the local cache."""
+        self._var_cache.clear()
     
     def set_condition(self, condition: bool) -> None:
         """
@@ -197,7 +729,62 @@ class Cronium:
         Args:
             condition: True or False to control conditional workflow paths
         """
-        self._make_request("POST", f"/executions/{self.execution_id}/condition", {"condition": condition})
+        if not self._defer_write("condition", "POST", self._condition_path, {"condition": condition}):
+            self._make_request("POST", self._condition_path, {"condition": condition}, idempotent=True)
+    
+    def _defer_write(self, target: str, method: str, path: str, data: Any) -> bool:
+        """
+        Queue a write while a batch is open.
+        
+        Returns:
+            True if the write was queued, False if it should be sent now
+        """
+        if self._pending is None:
+            return False
+        # Re-insert so flush sends writes in the order of their last update
+        self._pending.pop(target, None)
+        self._pending[target] = (method, path, data)
+        return True
+    
+    def _take_pending(self) -> list:
+        if not self._pending:
+            return []
+        pending = list(self._pending.values())
+        self._pending.clear()
+        return pending
+    
+    @contextmanager
+    def batch(self) -> Iterator["Cronium"]:
+        """
+        Defer output, set_variable and set_condition calls until the block exits.
+        
+        Repeated writes to the same variable (or output/condition) inside the
+        block are coalesced, so only the last value is sent. Variables set in
+        the block can be read back immediately from the local cache.
+        
+        Example:
+            with cronium.batch():
+                for item in items:
+                    cronium.set_variable("last_item", item)
+        """
+        if self._pending is not None:
+            # Already batching, the outer block flushes
+            yield self
+            return
+        
+        self._pending = {}
+        try:
+            yield self
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._pending = None
+    
+    def flush(self) -> None:
+        """Send all writes queued by batch()."""
+        for method, path, data in self._take_pending():
+            self._make_request(method, path, data, idempotent=True)
     
     def event(self) -> Dict[str, Any]:
         """
@@ -211,8 +798,7 @@ class Cronium:
             - userId: User who created the event
             - executionId: Current execution ID
         """
-        result = self._make_request("GET", f"/executions/{self.execution_id}/context")
-        return result.get("data", {}) if result else {}
+        return self._make_request("GET", self._context_path, extract=("data",)) or {}
     
     def execute_tool_action(self, tool: str, action: str, config: Dict[str, Any]) -> Any:
         """
@@ -225,34 +811,34 @@ class Cronium:
             
         Returns:
             The result from the tool action
+            
+        Raises:
+            CroniumAPIError: If the tool reports that the action failed
         """
         payload = {
             "tool": tool,
             "action": action,
             "config": config
         }
-        result = self._make_request("POST", "/tool-actions/execute", payload)
-        return result.get("data") if result else None
+        result = self._make_request("POST", self._tool_action_path, payload)
+        return _tool_action_data(result)
     
     # Convenience methods for common tool actions
     
-    def send_email(self, to: Union[str, list], subject: str, body: str, **kwargs) -> Any:
+    def send_email(self, to: Union[str, Iterable[str]], subject: str, body: str, **kwargs) -> Any:
         """
         Send an email using the email tool.
         
         Args:
-            to: Email recipient(s)
+            to: Email recipient, or an iterable of recipients
             subject: Email subject
             body: Email body (HTML supported)
             **kwargs: Additional email options (cc, bcc, attachments, etc.)
         """
-        config = {
-            "to": to if isinstance(to, list) else [to],
-            "subject": subject,
-            "body": body,
-            **kwargs
-        }
-        return self.execute_tool_action("email", "send_message", config)
+        kwargs["to"] = [to] if isinstance(to, str) else list(to)
+        kwargs["subject"] = subject
+        kwargs["body"] = body
+        return self.execute_tool_action("email", "send_message", kwargs)
     
     def send_slack_message(self, channel: str, text: str, **kwargs) -> Any:
         """
@@ -263,12 +849,9 @@ class Cronium:
             text: Message text
             **kwargs: Additional Slack options (attachments, blocks, etc.)
         """
-        config = {
-            "channel": channel,
-            "text": text,
-            **kwargs
-        }
-        return self.execute_tool_action("slack", "send_message", config)
+        kwargs["channel"] = channel
+        kwargs["text"] = text
+        return self.execute_tool_action("slack", "send_message", kwargs)
     
     def send_discord_message(self, channel_id: str, content: str, **kwargs) -> Any:
         """
@@ -279,12 +862,28 @@ class Cronium:
             content: Message content
             **kwargs: Additional Discord options (embeds, etc.)
         """
-        config = {
-            "channelId": channel_id,
-            "content": content,
-            **kwargs
-        }
-        return self.execute_tool_action("discord", "send_message", config)
+        kwargs["channelId"] = channel_id
+        kwargs["content"] = content
+        return self.execute_tool_action("discord", "send_message", kwargs)
+
+
+async def _run_concurrently(coros: List[Any]) -> List[Any]:
+    """
+    Run coroutines concurrently and return their results in order.
+    
+    Uses a TaskGroup where available (Python 3.11+) so the remaining calls are
+    cancelled as soon as one fails. The first failure is re-raised as-is
+    rather than wrapped in an ExceptionGroup.
+    """
+    if not hasattr(asyncio, "TaskGroup"):
+        return list(await asyncio.gather(*coros))
+    
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except BaseExceptionGroup as e:
+        raise e.exceptions[0]
+    return [task.result() for task in tasks]
 
 
 # Async support for advanced use cases
@@ -304,54 +903,89 @@ class AsyncCronium(Cronium):
         """Ensure aiohttp session is created."""
         if self._session is None:
             import aiohttp
+            # One pooled connector for all calls so concurrent requests reuse
+            # keep-alive connections instead of reconnecting
+            if self.socket_path:
+                connector = aiohttp.UnixConnector(path=self.socket_path, limit=100, limit_per_host=32)
+            else:
+                connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300)
+            # aiohttp sets Host from each request URL, which follows api_url
+            headers = {name: value for name, value in self.headers.items() if name != "Host"}
             self._session = aiohttp.ClientSession(
-                headers=self.headers,
+                connector=connector,
+                headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.timeout)
             )
     
-    async def _make_request(self, method: str, path: str, data: Any = None) -> Any:
+    def refresh_dns(self) -> None:
+        """Re-resolve the Runtime API host on the next connection."""
+        # Unix socket connectors have no DNS cache
+        clear_dns_cache = getattr(self._session and self._session.connector, "clear_dns_cache", None)
+        if clear_dns_cache is not None:
+            clear_dns_cache()
+    
+    async def _make_request(self, method: str, path: str, data: Any = None,
+                            idempotent: bool = False, extract: tuple = ()) -> Any:
+        """Make an async HTTP request through the circuit breaker."""
+        self._check_breaker()
+        try:
+            result = await self._request_with_retry(method, path, data, idempotent)
+        except CroniumError as e:
+            self._record_outcome(e)
+            raise
+        except BaseException:
+            # Cancelled or failed locally, the API was not judged
+            self._breaker.release_probe()
+            raise
+        self._record_outcome(None)
+        return _extract(result, extract) if extract else result
+    
+    async def _request_with_retry(self, method: str, path: str, data: Any = None,
+                                  idempotent: bool = False) -> Any:
         """Make an async HTTP request."""
         await self._ensure_session()
-        url = urljoin(self.api_url, path)
+        url = self._origin + path
+        body = _encode_body(data)
+        delays = self._retry_delays(idempotent or method in _IDEMPOTENT_METHODS)
         
-        for attempt in range(self.max_retries):
+        while True:
             try:
-                async with self._session.request(method, url, json=data) as response:
-                    if response.status >= 500 and attempt < self.max_retries - 1:
-                        await asyncio.sleep(self.retry_delay * (2 ** attempt))
-                        continue
-                    
-                    response_data = await response.json()
-                    
-                    if response.status >= 400:
-                        message = response_data.get("message", "Unknown error")
-                        raise CroniumAPIError(response.status, message)
-                    
-                    if isinstance(response_data, dict) and response_data.get("success") is False:
-                        raise CroniumAPIError(response.status, response_data.get("message", "Unknown error"))
-                    
-                    return response_data
-                    
-            except asyncio.TimeoutError:
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
-                    continue
-                raise CroniumTimeoutError("Request timed out")
-            
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
-                    continue
-                raise CroniumError(f"Request failed: {e}")
+                return await self._request_once(method, url, body)
+            except CroniumError as e:
+                if not _is_retryable(e):
+                    raise
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+    
+    async def _request_once(self, method: str, url: str, body: Optional[bytes]) -> Any:
+        """Make a single async request attempt, without retrying."""
+        try:
+            async with self._session.request(method, url, data=body) as response:
+                # Parse the raw bytes directly, skipping aiohttp's text decode
+                raw = await response.read()
+            if response.status < 400:
+                return _loads(raw) if raw else None
+        except CroniumError:
+            raise
+        except asyncio.TimeoutError as e:
+            raise CroniumTimeoutError("Request timed out") from e
+        except Exception as e:
+            raise CroniumError(f"Request failed: {e}") from e
         
-        raise CroniumError("Max retries exceeded")
+        if response.status == 404 and method == "GET":
+            raise CroniumAPIError(404, response.reason or "Not Found")
+        raise CroniumAPIError(response.status, _error_message(raw, response.reason or "Unknown error"))
     
     async def close(self):
         """Close the async session."""
         if self._session:
             await self._session.close()
+            self._session = None
     
     async def __aenter__(self):
+        await self._ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -359,30 +993,82 @@ class AsyncCronium(Cronium):
     
     # Async versions of all methods
     async def input(self) -> Any:
-        result = await self._make_request("GET", f"/executions/{self.execution_id}/input")
-        return result.get("data") if result else None
+        return await self._make_request("GET", self._input_path, extract=("data",))
     
     async def output(self, data: Any) -> None:
-        await self._make_request("POST", f"/executions/{self.execution_id}/output", {"data": data})
+        if not self._defer_write("output", "POST", self._output_path, {"data": data}):
+            await self._make_request("POST", self._output_path, {"data": data}, idempotent=True)
     
     async def get_variable(self, key: str) -> Any:
+        value = self._cached_variable(key)
+        if value is not _MISSING:
+            return value
+        
         try:
-            result = await self._make_request("GET", f"/executions/{self.execution_id}/variables/{quote(key)}")
-            return result.get("data", {}).get("value") if result else None
+            value = await self._make_request("GET", self._variables_path + _quote_key(key),
+                                             extract=("data", "value"))
         except CroniumAPIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+            if e.status_code != 404:
+                raise
+            value = None
+        self._cache_variable(key, value)
+        return value
     
     async def set_variable(self, key: str, value: Any) -> None:
-        await self._make_request("PUT", f"/executions/{self.execution_id}/variables/{quote(key)}", {"value": value})
+        path = self._variables_path + _quote_key(key)
+        if not self._defer_write(f"variable:{key}", "PUT", path, {"value": value}):
+            await self._make_request("PUT", path, {"value": value})
+        self._cache_variable(key, value)
     
     async def set_condition(self, condition: bool) -> None:
-        await self._make_request("POST", f"/executions/{self.execution_id}/condition", {"condition": condition})
+        if not self._defer_write("condition", "POST", self._condition_path, {"condition": condition}):
+            await self._make_request("POST", self._condition_path, {"condition": condition}, idempotent=True)
+    
+    async def get_variables(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get several variable values concurrently.
+        
+        Args:
+            keys: The variable keys to retrieve
+            
+        Returns:
+            Mapping of each key to its value, or None if not set
+        """
+        keys = list(dict.fromkeys(keys))
+        return dict(zip(keys, await _run_concurrently([self.get_variable(key) for key in keys])))
+    
+    async def set_variables(self, variables: Dict[str, Any]) -> None:
+        """
+        Set several variables concurrently.
+        
+        Args:
+            variables: Mapping of variable keys to values
+        """
+        await _run_concurrently([self.set_variable(key, value) for key, value in variables.items()])
+    
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator["AsyncCronium"]:
+        """Async version of Cronium.batch()."""
+        if self._pending is not None:
+            yield self
+            return
+        
+        self._pending = {}
+        try:
+            yield self
+        finally:
+            try:
+                await self.flush()
+            finally:
+                self._pending = None
+    
+    async def flush(self) -> None:
+        """Send all writes queued by batch()."""
+        for method, path, data in self._take_pending():
+            await self._make_request(method, path, data, idempotent=True)
     
     async def event(self) -> Dict[str, Any]:
-        result = await self._make_request("GET", f"/executions/{self.execution_id}/context")
-        return result.get("data", {}) if result else {}
+        return await self._make_request("GET", self._context_path, extract=("data",)) or {}
     
     async def execute_tool_action(self, tool: str, action: str, config: Dict[str, Any]) -> Any:
         payload = {
@@ -390,8 +1076,8 @@ class AsyncCronium(Cronium):
             "action": action,
             "config": config
         }
-        result = await self._make_request("POST", "/tool-actions/execute", payload)
-        return result.get("data") if result else None
+        result = await self._make_request("POST", self._tool_action_path, payload)
+        return _tool_action_data(result)
     
     async def stream_input(self) -> AsyncIterator[Any]:
         """
@@ -409,27 +1095,151 @@ class AsyncCronium(Cronium):
         """
         Stream output data in chunks (future implementation).
         
+        Each chunk is encoded as it arrives, so only the JSON bytes are held
+        until the chunks are sent as a single output list.
+        
         Args:
             data_iterator: Async iterator yielding data chunks
         """
         # TODO: Implement streaming support when backend supports it
-        chunks = []
+        body = bytearray(b'{"data":[')
+        separator = b""
         async for chunk in data_iterator:
-            chunks.append(chunk)
-        await self.output(chunks)
-
-
-# Create global instance
-cronium = Cronium()
-
-# For backward compatibility and convenience
-input = cronium.input
-output = cronium.output
-get_variable = cronium.get_variable
-set_variable = cronium.set_variable
-set_condition = cronium.set_condition
-event = cronium.event
-execute_tool_action = cronium.execute_tool_action
-send_email = cronium.send_email
-send_slack_message = cronium.send_slack_message
-send_discord_message = cronium.send_discord_message
\ No newline at end of file
+            body += separator
+            body += _dumps(chunk)
+            separator = b","
+        body += b"]}"
+        
+        if not self._defer_write("output", "POST", self._output_path, body):
+            await self._make_request("POST", self._output_path, body, idempotent=True)
+
+
+def _uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Get uvloop's event loop factory if it is installed and enabled."""
+    if sys.platform == "win32" or os.environ.get("CRONIUM_USE_UVLOOP", "1") != "1":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Awaitable[Any]) -> Any:
+    """
+    Run an async entrypoint, using uvloop when it is installed.
+    
+    uvloop has lower per-operation overhead than the default asyncio event
+    loop, which adds up for scripts making many Runtime API calls. Set
+    CRONIUM_USE_UVLOOP=0 to use the default event loop.
+    
+    Args:
+        main: The coroutine to run
+        
+    Returns:
+        The coroutine's result
+    
+    Example:
+        async def main():
+            async with AsyncCronium() as client:
+                await client.output(await client.input())
+        
+        cronium.run(main())
+    """
+    loop_factory = _uvloop_factory()
+    if loop_factory is None:
+        return asyncio.run(main)
+    
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(main)
+    
+    # Python < 3.11 has no loop_factory, swap the policy for this run only
+    import uvloop
+    previous_policy = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        return asyncio.run(main)
+    finally:
+        asyncio.set_event_loop_policy(previous_policy)
+
+
+# Worker threads for gather(), created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# Set on those worker threads so nested gather() calls can tell
+_worker = threading.local()
+
+
+def _mark_worker() -> None:
+    _worker.active = True
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="cronium",
+                                           initializer=_mark_worker)
+        return _executor
+
+
+def gather(calls: Iterable[Callable[[], Any]]) -> List[Any]:
+    """
+    Run independent SDK calls concurrently and return their results in order.
+    
+    Each call runs on a worker thread and gets its own pooled connection, so
+    the network round trips overlap instead of running back to back. Calls
+    should not be made inside batch(), which is not thread-safe. A gather()
+    nested inside another gather() call runs its calls inline, since waiting
+    on the shared workers from one of them could deadlock.
+    
+    Args:
+        calls: Zero-argument callables, e.g. lambda: get_variable("key")
+        
+    Returns:
+        The result of each call, in the order given
+        
+    Raises:
+        The first exception raised by a call, in call order
+    
+    Example:
+        data, last_run = cronium.gather([
+            cronium.input,
+            lambda: cronium.get_variable("last_run"),
+        ])
+    """
+    if getattr(_worker, "active", False):
+        return [call() for call in calls]
+    executor = _get_executor()
+    futures = [executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
+# Module-level convenience functions, bound to the default client
+_CONVENIENCE_FUNCTIONS = frozenset({
+    "input", "output", "get_variable", "set_variable", "get_variables",
+    "set_variables", "set_condition", "event", "execute_tool_action",
+    "send_email", "send_slack_message", "send_discord_message",
+})
+_default_client_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the default client on first use of the module-level API (PEP 562).
+    
+    Importing the module needs no environment variables and does no setup
+    work. Once created, the client and its convenience functions are stored
+    as ordinary module attributes, so later lookups skip this hook.
+    """
+    if name != "cronium" and name not in _CONVENIENCE_FUNCTIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    namespace = globals()
+    with _default_client_lock:
+        if "cronium" not in namespace:
+            client = Cronium()
+            namespace.update({func: getattr(client, func) for func in _CONVENIENCE_FUNCTIONS})
+            namespace["cronium"] = client
+    return namespace[name]
@@ -4,26 +4,30 @@ Health check script for Python Cronium container
 """
 import sys
 import os
+import importlib.util
 
 def main():
     """Perform basic health checks"""
     try:
-        # Check if cronium module can be imported
-        import cronium
+        # Check Python version first, it needs no I/O
+        if sys.version_info < (3, 12):
+            print(f"Python version too old: {sys.version}")
+            sys.exit(1)
+        
+        # Check the cronium module is installed without executing it
+        if importlib.util.find_spec("cronium") is None:
+            print("Health check failed: cronium module not found")
+            sys.exit(1)
         
         # Check environment variables are set
         required_env = ['CRONIUM_RUNTIME_API', 'CRONIUM_EXECUTION_TOKEN', 'CRONIUM_EXECUTION_ID']
         
-        # In health check mode, these might not be set, so we just check the module loads
+        # In health check mode, these might not be set, so only import and
+        # initialize the SDK when they are
         if all(var in os.environ for var in required_env):
-            # If env vars are set, verify the module initializes
+            cronium = importlib.import_module("cronium")
             _ = cronium.Cronium()
         
-        # Check Python version
-        if sys.version_info < (3, 12):
-            print(f"Python version too old: {sys.version}")
-            sys.exit(1)
-        
         print("Health check passed")
         sys.exit(0)
         
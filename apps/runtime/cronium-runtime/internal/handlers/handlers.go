@@ -3,6 +3,7 @@ package handlers
 import (
 	"encoding/json"
 	"net/http"
+	"net/url"
 
 	"github.com/addison-moore/cronium/apps/runtime/internal/middleware"
 	"github.com/addison-moore/cronium/apps/runtime/internal/service"
@@ -83,7 +84,11 @@ func (h *Handler) SetOutput(w http.ResponseWriter, r *http.Request) {
 // GetVariable handles GET /executions/{id}/variables/{key}
 func (h *Handler) GetVariable(w http.ResponseWriter, r *http.Request) {
 	executionID := chi.URLParam(r, "id")
-	key := chi.URLParam(r, "key")
+	key, err := variableKey(r)
+	if err != nil {
+		h.writeError(w, http.StatusBadRequest, "invalid variable key")
+		return
+	}
 	
 	// Verify token matches execution
 	claims, ok := middleware.GetTokenClaims(r.Context())
@@ -122,7 +127,11 @@ func (h *Handler) GetVariable(w http.ResponseWriter, r *http.Request) {
 // SetVariable handles PUT /executions/{id}/variables/{key}
 func (h *Handler) SetVariable(w http.ResponseWriter, r *http.Request) {
 	executionID := chi.URLParam(r, "id")
-	key := chi.URLParam(r, "key")
+	key, err := variableKey(r)
+	if err != nil {
+		h.writeError(w, http.StatusBadRequest, "invalid variable key")
+		return
+	}
 	
 	// Verify token matches execution
 	claims, _ := middleware.GetTokenClaims(r.Context())
@@ -252,4 +261,15 @@ func (h *Handler) writeError(w http.ResponseWriter, status int, message string)
 		Error:   http.StatusText(status),
 		Message: message,
 	})
-}
\ No newline at end of file
+}
+
+// variableKey returns the decoded {key} URL parameter. chi routes on the
+// escaped path when it contains escapes such as %2F, which leaves the
+// parameter escaped.
+func variableKey(r *http.Request) (string, error) {
+	key := chi.URLParam(r, "key")
+	if r.URL.RawPath == "" {
+		return key, nil
+	}
+	return url.PathUnescape(key)
+}
@@ -34,10 +34,12 @@ setup(
     install_requires=[],
     extras_require={
         "async": ["aiohttp>=3.8.0"],
+        "speedups": ["orjson>=3.9.0", "uvloop>=0.17.0; sys_platform != 'win32'"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
             "pytest-mock>=3.10.0",
+            "aiohttp>=3.8.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -4,10 +4,20 @@ Unit tests for Cronium Python SDK
 
 import os
 import json
+import time
+import socket
+import socketserver
+import threading
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from urllib.error import HTTPError, URLError
+from unittest.mock import Mock, patch
+from http.client import RemoteDisconnected
+from http.server import BaseHTTPRequestHandler
+from types import SimpleNamespace
 import asyncio
+import importlib.util
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 # Set required environment variables before import
 os.environ["CRONIUM_RUNTIME_API"] = "http://localhost:8081"
@@ -18,6 +28,16 @@ import cronium
 from cronium import Cronium, AsyncCronium, CroniumError, CroniumAPIError, CroniumTimeoutError
 
 
+def make_response(body=None, status=200):
+    """Build a mock http.client response"""
+    response = Mock()
+    response.status = status
+    response.reason = "OK" if status < 400 else "Error"
+    response.will_close = False
+    response.read.return_value = json.dumps(body).encode() if body is not None else b""
+    return response
+
+
 class TestCronium:
     """Test cases for synchronous Cronium client"""
     
@@ -25,122 +45,257 @@ class TestCronium:
         """Reset environment for each test"""
         self.client = Cronium()
     
-    @patch('cronium.urlopen')
-    def test_input_success(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_input_success(self, mock_http):
         """Test successful input retrieval"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({
             "success": True,
             "data": {"key": "value"}
-        }).encode()
-        mock_urlopen.return_value = mock_response
+        })
         
         result = self.client.input()
         assert result == {"key": "value"}
         
         # Verify request details
-        request = mock_urlopen.call_args[0][0]
-        assert request.get_full_url() == "http://localhost:8081/executions/test-execution-id/input"
-        assert request.get_method() == "GET"
-        assert request.headers["Authorization"] == "Bearer test-token"
+        mock_http.assert_called_once()
+        assert mock_http.call_args[0][1] == 8081
+        method, path = mock_conn.request.call_args[0]
+        headers = mock_conn.request.call_args[1]["headers"]
+        assert path == "/executions/test-execution-id/input"
+        assert method == "GET"
+        assert headers["Authorization"] == b"Bearer test-token"
+        assert headers["User-Agent"] == f"cronium-python/{cronium.__version__}".encode()
+        assert headers["Host"] == b"localhost:8081"
     
-    @patch('cronium.urlopen')
-    def test_output_success(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_output_success(self, mock_http):
         """Test successful output setting"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({"success": True}).encode()
-        mock_urlopen.return_value = mock_response
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
         
         self.client.output({"result": "success"})
         
         # Verify request details
-        request = mock_urlopen.call_args[0][0]
-        assert request.get_full_url() == "http://localhost:8081/executions/test-execution-id/output"
-        assert request.get_method() == "POST"
-        assert json.loads(request.data) == {"data": {"result": "success"}}
+        method, path = mock_conn.request.call_args[0]
+        body = mock_conn.request.call_args[1]["body"]
+        assert path == "/executions/test-execution-id/output"
+        assert method == "POST"
+        assert json.loads(body) == {"data": {"result": "success"}}
+    
+    @patch('cronium.HTTPConnection')
+    def test_output_encodes_like_json_module(self, mock_http):
+        """Test output accepts non-str keys and big integers like json.dumps"""
+        mock_http.return_value.getresponse.return_value = make_response({"success": True})
+        
+        self.client.output({1: "a", "big": 2**70})
+        
+        body = mock_http.return_value.request.call_args[1]["body"]
+        assert json.loads(body) == {"data": {"1": "a", "big": 2**70}}
     
-    @patch('cronium.urlopen')
-    def test_get_variable_success(self, mock_urlopen):
+    def test_unix_socket_transport(self, tmp_path, monkeypatch):
+        """Test requests go over CRONIUM_RUNTIME_SOCK when it is set"""
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps({"success": True, "data": self.path}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        socket_path = str(tmp_path / "runtime.sock")
+        server = socketserver.UnixStreamServer(socket_path, Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            monkeypatch.setenv("CRONIUM_RUNTIME_SOCK", socket_path)
+            client = Cronium()
+            assert client.input() == "/executions/test-execution-id/input"
+        finally:
+            server.shutdown()
+            server.server_close()
+    
+    @patch('cronium.HTTPConnection')
+    def test_get_variable_success(self, mock_http):
         """Test successful variable retrieval"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({
+        mock_http.return_value.getresponse.return_value = make_response({
             "success": True,
             "data": {"key": "test_var", "value": "test_value"}
-        }).encode()
-        mock_urlopen.return_value = mock_response
+        })
         
         result = self.client.get_variable("test_var")
         assert result == "test_value"
     
-    @patch('cronium.urlopen')
-    def test_get_variable_not_found(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_variable_key_is_one_path_segment(self, mock_http):
+        """Test slashes and spaces in keys are percent-encoded"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
+        
+        self.client.set_variable("../input key", 1)
+        
+        path = mock_conn.request.call_args[0][1]
+        assert path == "/executions/test-execution-id/variables/..%2Finput%20key"
+    
+    @patch('cronium.HTTPConnection')
+    def test_get_variable_not_found(self, mock_http):
         """Test variable not found returns None"""
-        mock_urlopen.side_effect = HTTPError(
-            "http://localhost:8081/executions/test-execution-id/variables/missing",
-            404,
-            "Not Found",
-            {},
-            Mock(read=lambda: b'{"message": "Variable not found"}')
+        mock_http.return_value.getresponse.return_value = make_response(
+            {"message": "Variable not found"}, status=404
         )
         
         result = self.client.get_variable("missing")
         assert result is None
     
-    @patch('cronium.urlopen')
-    def test_set_variable_success(self, mock_urlopen):
+    @patch('cronium._error_message')
+    @patch('cronium.HTTPConnection')
+    def test_get_not_found_skips_error_body(self, mock_http, mock_error_message):
+        """Test a GET 404 is reported without parsing the error body"""
+        mock_http.return_value.getresponse.return_value = make_response(
+            {"message": "Not found"}, status=404
+        )
+        
+        with pytest.raises(CroniumAPIError) as exc_info:
+            self.client.input()
+        assert exc_info.value.status_code == 404
+        mock_error_message.assert_not_called()
+    
+    @patch('cronium.HTTPConnection')
+    def test_get_variable_cached(self, mock_http):
+        """Test repeated variable reads are served from the cache"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response({
+            "success": True,
+            "data": {"key": "test_var", "value": "test_value"}
+        })
+        
+        assert self.client.get_variable("test_var") == "test_value"
+        assert self.client.get_variable("test_var") == "test_value"
+        assert mock_conn.request.call_count == 1
+        
+        self.client.invalidate_variable("test_var")
+        self.client.get_variable("test_var")
+        assert mock_conn.request.call_count == 2
+    
+    @patch('cronium.HTTPConnection')
+    def test_set_variable_writes_through_cache(self, mock_http):
+        """Test a set variable is read back without a request"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
+        
+        self.client.set_variable("test_var", "new_value")
+        assert self.client.get_variable("test_var") == "new_value"
+        assert mock_conn.request.call_count == 1
+    
+    @patch('cronium.HTTPConnection')
+    def test_get_variables_fetches_uncached_keys(self, mock_http):
+        """Test get_variables only requests keys missing from the cache"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response({
+            "success": True,
+            "data": {"value": "fetched"}
+        })
+        
+        self.client.set_variable("a", 1)
+        result = self.client.get_variables(["a", "b", "c"])
+        
+        assert result == {"a": 1, "b": "fetched", "c": "fetched"}
+        paths = sorted(call[0][1] for call in mock_conn.request.call_args_list[1:])
+        assert paths == [
+            "/executions/test-execution-id/variables/b",
+            "/executions/test-execution-id/variables/c",
+        ]
+    
+    @patch('cronium.HTTPConnection')
+    def test_set_variables_in_batch(self, mock_http):
+        """Test set_variables inside a batch queues the writes"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response({"success": True})
+        
+        with self.client.batch():
+            self.client.set_variables({"a": 1, "b": 2})
+            self.client.set_variables({"a": 3})
+            assert mock_conn.request.call_count == 0
+        
+        bodies = sorted(
+            (call[0][1], json.loads(call[1]["body"])) for call in mock_conn.request.call_args_list
+        )
+        assert bodies == [
+            ("/executions/test-execution-id/variables/a", {"value": 3}),
+            ("/executions/test-execution-id/variables/b", {"value": 2}),
+        ]
+    
+    @patch('cronium.HTTPConnection')
+    def test_set_variable_success(self, mock_http):
         """Test successful variable setting"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({"success": True}).encode()
-        mock_urlopen.return_value = mock_response
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
         
         self.client.set_variable("test_var", "test_value")
         
         # Verify request
-        request = mock_urlopen.call_args[0][0]
-        assert "variables/test_var" in request.get_full_url()
-        assert json.loads(request.data) == {"value": "test_value"}
+        path = mock_conn.request.call_args[0][1]
+        body = mock_conn.request.call_args[1]["body"]
+        assert "variables/test_var" in path
+        assert json.loads(body) == {"value": "test_value"}
+    
+    @patch('cronium.HTTPConnection')
+    def test_batch_coalesces_writes(self, mock_http):
+        """Test writes in a batch are deferred and coalesced"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response({"success": True})
+        
+        with self.client.batch():
+            for i in range(10):
+                self.client.set_variable("counter", i)
+            self.client.output({"done": True})
+            assert mock_conn.request.call_count == 0
+            assert self.client.get_variable("counter") == 9
+        
+        assert mock_conn.request.call_count == 2
+        bodies = [json.loads(c[1]["body"]) for c in mock_conn.request.call_args_list]
+        assert bodies == [{"value": 9}, {"data": {"done": True}}]
     
-    @patch('cronium.urlopen')
-    def test_set_condition_success(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_set_condition_success(self, mock_http):
         """Test successful condition setting"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({"success": True}).encode()
-        mock_urlopen.return_value = mock_response
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
         
         self.client.set_condition(True)
         
         # Verify request
-        request = mock_urlopen.call_args[0][0]
-        assert request.get_full_url() == "http://localhost:8081/executions/test-execution-id/condition"
-        assert json.loads(request.data) == {"condition": True}
+        path = mock_conn.request.call_args[0][1]
+        body = mock_conn.request.call_args[1]["body"]
+        assert path == "/executions/test-execution-id/condition"
+        assert json.loads(body) == {"condition": True}
     
-    @patch('cronium.urlopen')
-    def test_event_context_success(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_event_context_success(self, mock_http):
         """Test successful event context retrieval"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({
+        mock_http.return_value.getresponse.return_value = make_response({
             "success": True,
             "data": {
                 "id": "event-123",
                 "name": "Test Event",
                 "type": "SCRIPT"
             }
-        }).encode()
-        mock_urlopen.return_value = mock_response
+        })
         
         result = self.client.event()
         assert result["id"] == "event-123"
         assert result["name"] == "Test Event"
     
-    @patch('cronium.urlopen')
-    def test_execute_tool_action_success(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_execute_tool_action_success(self, mock_http):
         """Test successful tool action execution"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({
+        mock_http.return_value.getresponse.return_value = make_response({
             "success": True,
             "data": {"messageId": "12345"}
-        }).encode()
-        mock_urlopen.return_value = mock_response
+        })
         
         result = self.client.execute_tool_action("slack", "send_message", {
             "channel": "#general",
@@ -148,40 +303,177 @@ class TestCronium:
         })
         assert result == {"messageId": "12345"}
     
-    @patch('cronium.urlopen')
-    def test_retry_on_server_error(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_execute_tool_action_failure(self, mock_http):
+        """Test a failed tool action raises with the tool's error"""
+        mock_http.return_value.getresponse.return_value = make_response({
+            "success": False,
+            "error": "channel not found"
+        })
+        
+        with pytest.raises(CroniumAPIError) as exc_info:
+            self.client.execute_tool_action("slack", "send_message", {"channel": "#nope"})
+        assert exc_info.value.message == "channel not found"
+    
+    @patch('cronium.HTTPConnection')
+    def test_api_url_change_applies(self, mock_http):
+        """Test assigning api_url redirects later requests"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response({"success": True, "data": "ok"})
+        self.client.input()
+        
+        self.client.api_url = "http://runtime-api:9000"
+        self.client.input()
+        
+        mock_conn.close.assert_called()
+        assert mock_http.call_args[0][:2] == ("runtime-api", 9000)
+        assert mock_conn.request.call_args[1]["headers"]["Host"] == b"runtime-api:9000"
+    
+    @patch('cronium.HTTPConnection')
+    def test_timeout_change_applies(self, mock_http):
+        """Test changing the client timeout reaches new and pooled connections"""
+        mock_conn = mock_http.return_value
+        mock_conn.timeout = 30
+        mock_conn.getresponse.side_effect = lambda: make_response({"success": True, "data": "ok"})
+        
+        self.client.input()
+        assert mock_http.call_args[1]["timeout"] == 30
+        
+        self.client.timeout = 2
+        self.client.input()
+        assert mock_conn.timeout == 2
+        mock_conn.sock.settimeout.assert_called_with(2)
+        
+        self.client._pool.close()
+        self.client.input()
+        assert mock_http.call_args[1]["timeout"] == 2
+    
+    @patch('cronium.HTTPConnection')
+    def test_connection_reused(self, mock_http):
+        """Test keep-alive connection is reused across calls"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response({"success": True, "data": "ok"})
+        
+        self.client.input()
+        self.client.output("done")
+        self.client.set_condition(True)
+        
+        assert mock_http.call_count == 1
+        assert mock_conn.request.call_count == 3
+    
+    @patch('cronium.HTTPConnection')
+    def test_written_post_not_resent(self, mock_http):
+        """Test a POST whose reused connection drops after sending is not resent"""
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = RemoteDisconnected("closed")
+        self.client._pool._idle.append(stale_conn)
+        
+        with pytest.raises(CroniumError):
+            self.client.execute_tool_action("slack", "send_message", {"channel": "#ops"})
+        assert stale_conn.request.call_count == 1
+        assert mock_http.call_count == 0
+    
+    @patch('cronium.HTTPConnection')
+    def test_unsent_post_retried_on_fresh_connection(self, mock_http):
+        """Test a POST that failed before being written goes out on a fresh connection"""
+        stale_conn = Mock()
+        stale_conn.request.side_effect = BrokenPipeError()
+        self.client._pool._idle.append(stale_conn)
+        mock_http.return_value.getresponse.return_value = make_response({"success": True, "data": "sent"})
+        
+        assert self.client.execute_tool_action("slack", "send_message", {"channel": "#ops"}) == "sent"
+        assert mock_http.return_value.request.call_count == 1
+    
+    def test_dns_resolved_once(self, monkeypatch):
+        """Test the Runtime API host is resolved once and each address is tried"""
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps({"success": True, "data": "ok"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = socketserver.TCPServer(("127.0.0.1", 0), Handler)
+        port = server.server_address[1]
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            dead_port = closed.getsockname()[1]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            getaddrinfo = Mock(return_value=[
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", dead_port)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+            ])
+            monkeypatch.setattr(cronium.socket, "getaddrinfo", getaddrinfo)
+            monkeypatch.setenv("CRONIUM_RUNTIME_API", f"http://runtime-api:{port}")
+            client = Cronium()
+            client._pool.maxsize = 0  # Force a new connection per call
+            
+            assert client.input() == "ok"
+            assert client.input() == "ok"
+            assert getaddrinfo.call_count == 1
+            assert getaddrinfo.call_args[0][:2] == ("runtime-api", port)
+            
+            client.refresh_dns()
+            client.input()
+            assert getaddrinfo.call_count == 2
+        finally:
+            server.shutdown()
+            server.server_close()
+    
+    @patch('cronium.HTTPConnection')
+    def test_stale_connection_reconnects(self, mock_http):
+        """Test a keep-alive connection closed by the server is replaced"""
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = RemoteDisconnected("closed")
+        fresh_conn = Mock()
+        fresh_conn.getresponse.return_value = make_response({"success": True, "data": "ok"})
+        self.client._pool._idle.append(stale_conn)
+        mock_http.return_value = fresh_conn
+        
+        result = self.client.input()
+        assert result == "ok"
+        stale_conn.close.assert_called_once()
+        assert mock_http.call_count == 1
+    
+    @patch('cronium.HTTPConnection')
+    def test_retry_on_server_error(self, mock_http):
         """Test retry logic on server errors"""
         # First two calls fail with 500, third succeeds
-        mock_urlopen.side_effect = [
-            HTTPError("url", 500, "Server Error", {}, Mock(read=lambda: b'{"message": "Internal error"}')),
-            HTTPError("url", 500, "Server Error", {}, Mock(read=lambda: b'{"message": "Internal error"}')),
-            Mock(read=Mock(return_value=json.dumps({"success": True, "data": "success"}).encode()))
+        mock_http.return_value.getresponse.side_effect = [
+            make_response({"message": "Internal error"}, status=500),
+            make_response({"message": "Internal error"}, status=500),
+            make_response({"success": True, "data": "success"})
         ]
         
         with patch('time.sleep'):  # Skip actual sleep in tests
             result = self.client.input()
             assert result == "success"
-            assert mock_urlopen.call_count == 3
+            assert mock_http.return_value.request.call_count == 3
     
-    @patch('cronium.urlopen')
-    def test_timeout_retry(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_timeout_retry(self, mock_http):
         """Test retry on timeout"""
-        mock_urlopen.side_effect = [
-            URLError("timed out"),
-            Mock(read=Mock(return_value=json.dumps({"success": True, "data": "success"}).encode()))
+        mock_http.return_value.getresponse.side_effect = [
+            socket.timeout("timed out"),
+            make_response({"success": True, "data": "success"})
         ]
         
         with patch('time.sleep'):
             result = self.client.input()
             assert result == "success"
-            assert mock_urlopen.call_count == 2
+            assert mock_http.return_value.request.call_count == 2
     
-    @patch('cronium.urlopen')
-    def test_max_retries_exceeded(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_max_retries_exceeded(self, mock_http):
         """Test max retries exceeded raises error"""
-        mock_urlopen.side_effect = HTTPError(
-            "url", 500, "Server Error", {},
-            Mock(read=lambda: b'{"message": "Internal error"}')
+        mock_http.return_value.getresponse.side_effect = lambda: make_response(
+            {"message": "Internal error"}, status=500
         )
         
         with patch('time.sleep'):
@@ -189,12 +481,95 @@ class TestCronium:
                 self.client.input()
             assert exc_info.value.status_code == 500
     
-    @patch('cronium.urlopen')
-    def test_send_email_convenience(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_tool_action_not_retried(self, mock_http):
+        """Test non-idempotent tool actions are not retried"""
+        mock_http.return_value.getresponse.side_effect = lambda: make_response(
+            {"message": "Internal error"}, status=500
+        )
+        
+        with patch('time.sleep') as mock_sleep:
+            with pytest.raises(CroniumAPIError):
+                self.client.execute_tool_action("slack", "send_message", {})
+            assert mock_http.return_value.request.call_count == 1
+            mock_sleep.assert_not_called()
+    
+    @patch('cronium.HTTPConnection')
+    def test_retry_deadline_exceeded(self, mock_http):
+        """Test retries stop when the backoff would pass the deadline"""
+        mock_http.return_value.getresponse.side_effect = lambda: make_response(
+            {"message": "Internal error"}, status=500
+        )
+        self.client.retry_deadline = 0
+        
+        with patch('time.sleep'), patch('cronium.random.uniform', return_value=1.0):
+            with pytest.raises(CroniumTimeoutError):
+                self.client.input()
+            assert mock_http.return_value.request.call_count == 1
+    
+    @patch('cronium.HTTPConnection')
+    def test_circuit_breaker_opens(self, mock_http):
+        """Test repeated failures open the circuit and skip the network"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.side_effect = lambda: make_response(
+            {"message": "Internal error"}, status=500
+        )
+        
+        with patch('time.sleep'):
+            for _ in range(5):
+                with pytest.raises(CroniumAPIError):
+                    self.client.input()
+            calls = mock_conn.request.call_count
+            
+            with pytest.raises(CroniumAPIError) as exc_info:
+                self.client.input()
+            assert exc_info.value.status_code == 503
+            assert mock_conn.request.call_count == calls
+    
+    @patch('cronium.HTTPConnection')
+    def test_circuit_breaker_probe_closes(self, mock_http):
+        """Test a successful probe after the reset timeout closes the circuit"""
+        mock_http.return_value.getresponse.return_value = make_response(
+            {"success": True, "data": "ok"}
+        )
+        breaker = self.client._breaker
+        breaker.state = breaker.OPEN
+        breaker.opened_at = time.monotonic() - breaker.reset_timeout
+        
+        assert self.client.input() == "ok"
+        assert breaker.state == breaker.CLOSED
+    
+    @patch('cronium.HTTPConnection')
+    def test_circuit_breaker_local_error_releases_probe(self, mock_http):
+        """Test a probe that fails before reaching the API doesn't wedge the circuit"""
+        mock_http.return_value.getresponse.return_value = make_response(
+            {"success": True, "data": "ok"}
+        )
+        breaker = self.client._breaker
+        breaker.state = breaker.OPEN
+        breaker.opened_at = time.monotonic() - breaker.reset_timeout
+        
+        with pytest.raises(TypeError):
+            self.client.output(object())
+        assert self.client.input() == "ok"
+        assert breaker.state == breaker.CLOSED
+    
+    def test_circuit_breaker_lost_probe_expires(self):
+        """Test a half-open circuit lets a new probe through after the reset timeout"""
+        breaker = self.client._breaker
+        breaker.state = breaker.OPEN
+        breaker.opened_at = time.monotonic() - breaker.reset_timeout
+        
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.opened_at -= breaker.reset_timeout
+        assert breaker.allow()
+    
+    @patch('cronium.HTTPConnection')
+    def test_send_email_convenience(self, mock_http):
         """Test send_email convenience method"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({"success": True}).encode()
-        mock_urlopen.return_value = mock_response
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
         
         self.client.send_email(
             to="test@example.com",
@@ -204,13 +579,70 @@ class TestCronium:
         )
         
         # Verify request payload
-        request = mock_urlopen.call_args[0][0]
-        payload = json.loads(request.data)
+        payload = json.loads(mock_conn.request.call_args[1]["body"])
         assert payload["tool"] == "email"
         assert payload["action"] == "send_message"
         assert payload["config"]["to"] == ["test@example.com"]
         assert payload["config"]["cc"] == ["cc@example.com"]
     
+    @patch('cronium.HTTPConnection')
+    def test_send_email_recipient_tuple(self, mock_http):
+        """Test send_email accepts any iterable of recipients"""
+        mock_conn = mock_http.return_value
+        mock_conn.getresponse.return_value = make_response({"success": True})
+        
+        self.client.send_email(("a@example.com", "b@example.com"), "Test", "Hello")
+        
+        payload = json.loads(mock_conn.request.call_args[1]["body"])
+        assert payload["config"]["to"] == ["a@example.com", "b@example.com"]
+    
+    def test_ssl_context_shared_and_lazy(self, monkeypatch):
+        """Test the SSL context is only built for HTTPS and shared by clients"""
+        monkeypatch.setattr(cronium, "_ssl_context", None)
+        with patch('cronium.ssl.create_default_context') as mock_create:
+            Cronium()
+            mock_create.assert_not_called()
+            
+            monkeypatch.setenv("CRONIUM_RUNTIME_API", "https://runtime.example.com")
+            first = Cronium()._pool._new_connection()
+            second = Cronium()._pool._new_connection()
+            mock_create.assert_called_once()
+            assert first._context is second._context
+    
+    def test_https_ipv6_host(self, monkeypatch):
+        """Test an IPv6 HTTPS Runtime API URL without a port connects to 443"""
+        monkeypatch.setenv("CRONIUM_RUNTIME_API", "https://[::1]/")
+        conn = Cronium()._pool._new_connection()
+        assert (conn.host, conn.port) == ("::1", 443)
+    
+    def test_ssl_context_assignment_applies(self, monkeypatch):
+        """Test an ssl_context set after construction is used for new connections"""
+        monkeypatch.setenv("CRONIUM_RUNTIME_API", "https://runtime.example.com")
+        client = Cronium()
+        idle_conn = Mock()
+        client._pool._idle.append(idle_conn)
+        context = cronium.ssl.create_default_context()
+        
+        client.ssl_context = context
+        idle_conn.close.assert_called_once()
+        assert client._pool._new_connection()._context is context
+    
+    def test_ssl_context_customised_in_place(self, monkeypatch):
+        """Test changes made to client.ssl_context are used for new connections"""
+        monkeypatch.setenv("CRONIUM_RUNTIME_API", "https://runtime.example.com")
+        client = Cronium()
+        client.ssl_context.check_hostname = False
+        
+        context = client._pool._new_connection()._context
+        assert context is client.ssl_context
+        assert context is not cronium._default_ssl_context()
+        assert context.check_hostname is False
+    
+    def test_methods_can_be_patched(self):
+        """Test client methods can be patched on an instance"""
+        with patch.object(self.client, "input", return_value={"patched": True}):
+            assert self.client.input() == {"patched": True}
+    
     def test_missing_token_error(self):
         """Test error when token is missing"""
         del os.environ["CRONIUM_EXECUTION_TOKEN"]
@@ -228,127 +660,311 @@ class TestCronium:
         os.environ["CRONIUM_EXECUTION_ID"] = "test-execution-id"
 
 
+class TestGather:
+    """Test concurrent fan-out of SDK calls"""
+    
+    @patch('cronium.HTTPConnection')
+    def test_gather_returns_results_in_order(self, mock_http):
+        """Test gather runs every call and keeps result order"""
+        client = Cronium()
+        mock_http.return_value.getresponse.side_effect = lambda: make_response({
+            "success": True,
+            "data": {"value": "val"}
+        })
+        
+        results = cronium.gather([
+            client.input,
+            lambda: client.get_variable("x"),
+        ])
+        assert results == [{"value": "val"}, "val"]
+        assert mock_http.return_value.request.call_count == 2
+    
+    def test_nested_gather_does_not_deadlock(self):
+        """Test gather called from inside gather calls runs inline"""
+        # Occupy every worker before any of them nests a gather()
+        all_busy = threading.Barrier(16)
+        
+        def fan_out(i):
+            all_busy.wait(timeout=5)
+            return cronium.gather([lambda: i, lambda: i * 2])
+        
+        results = []
+        outer = threading.Thread(target=lambda: results.extend(cronium.gather([
+            lambda i=i: fan_out(i) for i in range(16)
+        ])), daemon=True)
+        outer.start()
+        outer.join(timeout=5)
+        
+        assert not outer.is_alive()
+        assert results == [[i, i * 2] for i in range(16)]
+    
+    def test_gather_propagates_errors(self):
+        """Test gather re-raises a failing call's exception"""
+        def fail():
+            raise CroniumError("boom")
+        
+        with pytest.raises(CroniumError):
+            cronium.gather([lambda: 1, fail])
+
+
+class TestRun:
+    """Test the async entrypoint helper"""
+    
+    def test_run_returns_result(self):
+        """Test run executes the coroutine and returns its result"""
+        async def main():
+            return "done"
+        
+        assert cronium.run(main()) == "done"
+    
+    def test_run_uses_uvloop(self):
+        """Test run uses uvloop when it is installed"""
+        uvloop = pytest.importorskip("uvloop")
+        
+        async def main():
+            return asyncio.get_running_loop()
+        
+        assert isinstance(cronium.run(main()), uvloop.Loop)
+    
+    def test_run_uvloop_disabled(self, monkeypatch):
+        """Test CRONIUM_USE_UVLOOP=0 keeps the default event loop"""
+        monkeypatch.setenv("CRONIUM_USE_UVLOOP", "0")
+        
+        async def main():
+            return type(asyncio.get_running_loop()).__module__
+        
+        assert cronium.run(main()).startswith("asyncio")
+
+
+@pytest_asyncio.fixture
+async def runtime_api(monkeypatch):
+    """Run a local aiohttp server in place of the Runtime API"""
+    api = SimpleNamespace(requests=[], transports=set(), failures=0, delay=0, data={"key": "value"})
+    
+    async def handler(request):
+        api.transports.add(request.transport)
+        await asyncio.sleep(api.delay)
+        body = await request.read()
+        api.requests.append((request.method, request.path, json.loads(body) if body else None))
+        if api.failures:
+            api.failures -= 1
+            return web.json_response({"message": "Internal error"}, status=500)
+        return web.json_response({"success": True, "data": api.data})
+    
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", handler)
+    async with TestServer(app) as server:
+        monkeypatch.setenv("CRONIUM_RUNTIME_API", str(server.make_url("/")))
+        yield api
+
+
 class TestAsyncCronium:
     """Test cases for asynchronous Cronium client"""
     
     @pytest.mark.asyncio
-    async def test_async_input_success(self):
+    async def test_async_input_success(self, runtime_api):
         """Test async input retrieval"""
         async with AsyncCronium() as client:
-            with patch.object(client, '_session') as mock_session:
-                mock_response = MagicMock()
-                mock_response.status = 200
-                mock_response.json = asyncio.coroutine(lambda: {
-                    "success": True,
-                    "data": {"key": "value"}
-                })
-                
-                mock_session.request.return_value.__aenter__.return_value = mock_response
-                
-                result = await client.input()
-                assert result == {"key": "value"}
+            result = await client.input()
+            assert result == {"key": "value"}
+        
+        assert runtime_api.requests == [("GET", "/executions/test-execution-id/input", None)]
     
     @pytest.mark.asyncio
-    async def test_async_output_success(self):
+    async def test_async_output_success(self, runtime_api):
         """Test async output setting"""
         async with AsyncCronium() as client:
-            with patch.object(client, '_session') as mock_session:
-                mock_response = MagicMock()
-                mock_response.status = 200
-                mock_response.json = asyncio.coroutine(lambda: {"success": True})
-                
-                mock_session.request.return_value.__aenter__.return_value = mock_response
-                
-                await client.output({"result": "success"})
-                
-                # Verify request
-                mock_session.request.assert_called_once()
-                args = mock_session.request.call_args
-                assert args[0][0] == "POST"
-                assert args[1]["json"] == {"data": {"result": "success"}}
+            await client.output({"result": "success"})
+        
+        # Verify request
+        assert runtime_api.requests == [
+            ("POST", "/executions/test-execution-id/output", {"data": {"result": "success"}})
+        ]
     
     @pytest.mark.asyncio
-    async def test_async_retry_on_error(self):
+    async def test_async_retry_on_error(self, runtime_api):
         """Test async retry logic"""
+        # First call fails, second succeeds
+        runtime_api.failures = 1
+        runtime_api.data = "success"
+        
+        async with AsyncCronium() as client:
+            client.retry_delay = 0
+            result = await client.input()
+            assert result == "success"
+            assert len(runtime_api.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_async_empty_response(self):
+        """Test an empty response body parses to None"""
+        async def empty(request):
+            return web.Response(status=204)
+        
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", empty)
+        async with TestServer(app) as server:
+            async with AsyncCronium() as client:
+                client.api_url = str(server.make_url(""))
+                assert await client.input() is None
+    
+    @pytest.mark.asyncio
+    async def test_async_connection_reused(self, runtime_api):
+        """Test sequential async calls share one keep-alive connection"""
         async with AsyncCronium() as client:
-            with patch.object(client, '_session') as mock_session:
-                # First call fails, second succeeds
-                responses = [
-                    MagicMock(status=500, json=asyncio.coroutine(lambda: {"message": "Error"})),
-                    MagicMock(status=200, json=asyncio.coroutine(lambda: {"success": True, "data": "success"}))
-                ]
-                
-                mock_session.request.return_value.__aenter__.side_effect = responses
-                
-                with patch('asyncio.sleep'):
-                    result = await client.input()
-                    assert result == "success"
-                    assert mock_session.request.call_count == 2
+            for _ in range(20):
+                await client.input()
+        
+        assert len(runtime_api.requests) == 20
+        assert len(runtime_api.transports) == 1
     
     @pytest.mark.asyncio
-    async def test_stream_input_placeholder(self):
-        """Test stream_input placeholder implementation"""
+    async def test_async_refresh_dns(self, runtime_api):
+        """Test refresh_dns clears the aiohttp connector's DNS cache"""
+        async with AsyncCronium() as client:
+            client.refresh_dns()  # No session yet
+            await client.input()
+            with patch.object(client._session.connector, "clear_dns_cache") as clear:
+                client.refresh_dns()
+            clear.assert_called_once_with()
+    
+    @pytest.mark.asyncio
+    async def test_async_set_variables(self, runtime_api):
+        """Test set_variables sends every variable"""
         async with AsyncCronium() as client:
-            with patch.object(client, 'input', return_value={"data": "test"}):
-                chunks = []
-                async for chunk in client.stream_input():
-                    chunks.append(chunk)
-                assert chunks == [{"data": "test"}]
+            await client.set_variables({"a": 1, "b": 2, "c": 3})
+            assert await client.get_variable("b") == 2
+        
+        assert sorted((path, body) for _, path, body in runtime_api.requests) == [
+            ("/executions/test-execution-id/variables/a", {"value": 1}),
+            ("/executions/test-execution-id/variables/b", {"value": 2}),
+            ("/executions/test-execution-id/variables/c", {"value": 3}),
+        ]
     
     @pytest.mark.asyncio
-    async def test_stream_output_placeholder(self):
-        """Test stream_output placeholder implementation"""
+    async def test_async_cancelled_probe_releases_circuit(self, runtime_api):
+        """Test cancelling the half-open probe doesn't leave the circuit stuck"""
         async with AsyncCronium() as client:
-            async def data_generator():
-                yield {"chunk": 1}
-                yield {"chunk": 2}
+            breaker = client._breaker
+            breaker.state = breaker.OPEN
+            breaker.opened_at = time.monotonic() - breaker.reset_timeout
+            
+            runtime_api.delay = 1
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.input(), 0.2)
             
-            with patch.object(client, 'output') as mock_output:
-                await client.stream_output(data_generator())
-                mock_output.assert_called_once_with([{"chunk": 1}, {"chunk": 2}])
+            runtime_api.delay = 0
+            assert await client.input() == {"key": "value"}
+            assert breaker.state == breaker.CLOSED
+    
+    @pytest.mark.asyncio
+    async def test_async_get_variables(self, runtime_api):
+        """Test get_variables fetches each key once"""
+        runtime_api.data = {"value": 7}
+        
+        async with AsyncCronium() as client:
+            result = await client.get_variables(["a", "b", "a"])
+        
+        assert result == {"a": 7, "b": 7}
+        assert sorted(path for _, path, _ in runtime_api.requests) == [
+            "/executions/test-execution-id/variables/a",
+            "/executions/test-execution-id/variables/b",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_async_set_variables_error(self, runtime_api):
+        """Test set_variables raises the failing call's error"""
+        runtime_api.failures = 10
+        
+        async with AsyncCronium() as client:
+            client.retry_delay = 0
+            with pytest.raises(CroniumAPIError) as exc_info:
+                await client.set_variables({"a": 1, "b": 2})
+            assert exc_info.value.status_code == 500
+    
+    @pytest.mark.asyncio
+    async def test_stream_input_placeholder(self, runtime_api):
+        """Test stream_input placeholder implementation"""
+        async with AsyncCronium() as client:
+            chunks = []
+            async for chunk in client.stream_input():
+                chunks.append(chunk)
+            assert chunks == [{"key": "value"}]
+    
+    @pytest.mark.asyncio
+    async def test_stream_output_placeholder(self, runtime_api):
+        """Test stream_output sends the chunks as one output list"""
+        async def data_generator():
+            yield {"chunk": 1}
+            yield {"chunk": 2}
+        
+        async with AsyncCronium() as client:
+            await client.stream_output(data_generator())
+        
+        assert runtime_api.requests == [
+            ("POST", "/executions/test-execution-id/output", {"data": [{"chunk": 1}, {"chunk": 2}]})
+        ]
 
 
 class TestModuleLevelFunctions:
     """Test module-level convenience functions"""
     
-    @patch('cronium.urlopen')
-    def test_module_input_function(self, mock_urlopen):
+    def setup_method(self):
+        """Drop pooled connections left over from other tests"""
+        cronium.cronium._pool.close()
+    
+    @patch('cronium.HTTPConnection')
+    def test_module_input_function(self, mock_http):
         """Test module-level input function"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({
+        mock_http.return_value.getresponse.return_value = make_response({
             "success": True,
             "data": "test_data"
-        }).encode()
-        mock_urlopen.return_value = mock_response
+        })
         
         import cronium
         result = cronium.input()
         assert result == "test_data"
     
-    @patch('cronium.urlopen')
-    def test_module_output_function(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_module_output_function(self, mock_http):
         """Test module-level output function"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({"success": True}).encode()
-        mock_urlopen.return_value = mock_response
+        mock_http.return_value.getresponse.return_value = make_response({"success": True})
         
         import cronium
         cronium.output({"test": "data"})
-        assert mock_urlopen.called
+        assert mock_http.return_value.request.called
     
-    @patch('cronium.urlopen')
-    def test_module_get_variable_function(self, mock_urlopen):
+    @patch('cronium.HTTPConnection')
+    def test_module_get_variable_function(self, mock_http):
         """Test module-level get_variable function"""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({
+        mock_http.return_value.getresponse.return_value = make_response({
             "success": True,
             "data": {"key": "var", "value": "val"}
-        }).encode()
-        mock_urlopen.return_value = mock_response
+        })
         
         import cronium
         result = cronium.get_variable("var")
         assert result == "val"
+    
+    def test_import_without_environment(self, monkeypatch):
+        """Test importing needs no environment until the module API is used"""
+        monkeypatch.delenv("CRONIUM_EXECUTION_TOKEN")
+        spec = importlib.util.spec_from_file_location("cronium_fresh", cronium.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        with pytest.raises(module.CroniumError):
+            module.input()
+        with pytest.raises(AttributeError):
+            module.missing
+    
+    def test_star_import(self):
+        """Test from cronium import * still exports the convenience functions"""
+        namespace = {}
+        exec("from cronium import *", namespace)
+        
+        assert namespace["input"] == cronium.cronium.input
+        assert namespace["Cronium"] is Cronium
+        assert callable(namespace["gather"])
 
 
 if __name__ == "__main__":
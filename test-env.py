@@ -13,8 +13,10 @@ env_vars = [
     "CRONIUM_WORK_DIR"
 ]
 
+# Snapshot the environment once instead of querying os.environ per variable
+env = dict(os.environ)
 for var in env_vars:
-    value = os.environ.get(var, "NOT SET")
+    value = env.get(var, "NOT SET")
     if var == "CRONIUM_API_TOKEN" and value != "NOT SET":
         value = "SET (hidden)"
     print(f"{var}: {value}", file=sys.stderr)